@@ -59,24 +59,28 @@ class DESFire:
         result: list[int] = []
 
         def _wrap_native_iso_apdu(command: list[int]) -> list[int]:
-            payload = command[1:]
-            apdu = [0x90, command[0], 0x00, 0x00, len(payload)] + payload
-            if payload:
+            # CLA INS P1 P2 Lc [payload] built in one list construction, Le (0x00) only follows a payload
+            n = len(command) - 1
+            apdu = [0x90, command[0], 0x00, 0x00, n, *command[1:]]
+            if n:
                 apdu.append(0x00)
             return apdu
 
         def _unwrap_native_iso_response(response: list[int]) -> list[int]:
-            if len(response) < 2:
+            n = len(response)
+            if n < 2:
                 raise DESFireCommunicationError(
-                    f"Invalid response length {len(response)} from card. Expected at least 2 bytes for SW1 and SW2.",
+                    f"Invalid response length {n} from card. Expected at least 2 bytes for SW1 and SW2.",
                     response,
                 )
-            if response[-2] != 0x91:
+            sw1 = response[n - 2]
+            if sw1 != 0x91:
                 raise DESFireCommunicationError(
-                    f"Unexpected SW1 {response[-2]:02X} in response from card. Expected 0x91.",
-                    response[-2:],
+                    f"Unexpected SW1 {sw1:02X} in response from card. Expected 0x91.",
+                    response[n - 2 :],
                 )
-            return [response[-1]] + response[:-2]
+            # Move the status byte (SW2) in front of the data, single list construction
+            return [response[n - 1], *response[: n - 2]]
 
         def _split_command(command: list[int], frame_size: int) -> list[list[int]]:
             if len(command) <= frame_size:
@@ -127,7 +131,7 @@ class DESFire:
 
         if not native:
             status = resp[0]
-            result += list(resp[1:])
+            result += resp[1:]
 
             if status == 0xAF:
                 if af_passthrough:
@@ -138,7 +142,7 @@ class DESFire:
                     logger.debug("More data present (indicated by 0xAF), sending continue command")
                     resp = _transceive_frame(self._command(0xAF))
                     status = resp[0]
-                    result += list(resp[1:])
+                    result += resp[1:]
                     if status == 0xAF:
                         continue
                     if status != 0x00:
@@ -161,7 +165,7 @@ class DESFire:
 
         # DESfire native commands are used
         status = resp[0]
-        result += list(resp[1:])
+        result += resp[1:]
 
         if status == 0xAF:
             if af_passthrough:
@@ -172,7 +176,7 @@ class DESFire:
                 logger.debug("More data present (indicated by 0xAF), sending continue command")
                 resp = _transceive_frame(self._command(0xAF))
                 status = resp[0]
-                result += list(resp[1:])
+                result += resp[1:]
                 if status == 0xAF:
                     continue
                 if status != 0x00:
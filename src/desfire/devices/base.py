@@ -4,15 +4,33 @@ import abc
 class Device:
     """Abstract base class which uses underlying device communication channel."""
 
+    # Empty so subclasses can opt into __slots__, subclasses without them still get a __dict__
+    __slots__ = ()
+
     @abc.abstractmethod
-    def transceive(self, bytes: list[int]) -> list[int]:
+    def transceive(self, frame: bytes | list[int]) -> list[int]:
         """
         Send in APDU request and wait for the response.
 
         Args:
-            bytes (list[int]): Outgoing bytes as list of bytes or byte array
+            frame (bytes | list[int]): Outgoing bytes as list of bytes or byte array
 
         Returns:
             list[int]: List of bytes or byte array from the device.
         """
         raise NotImplementedError("Base class must implement")
+
+    def transceive_many(self, frames: list[bytes | list[int]]) -> list[list[int]]:
+        """
+        Send several APDU requests back to back and collect their responses.
+
+        Devices that can amortize per-call overhead across a batch may override this,
+        by default every frame is sent through `transceive`.
+
+        Args:
+            frames (list[bytes | list[int]]): Outgoing APDUs, each as list of bytes or byte array
+
+        Returns:
+            list[list[int]]: Responses from the device, in the order of the frames.
+        """
+        return [self.transceive(frame) for frame in frames]
@@ -2,7 +2,7 @@
 try:
     from smartcard.Exceptions import CardConnectionException
     from smartcard.pcsc.PCSCCardConnection import translateprotocolheader
-    from smartcard.scard import SCardGetErrorMessage, SCardTransmit
+    from smartcard.scard import SCardTransmit
 except ImportError:
     _has_pyscard = False
 else:
@@ -12,9 +12,27 @@ from ..exceptions import DESFireException
 from .base import Device
 
 
+def _transmit(hcard, pcscprotocolheader, frame: bytes | list[int]) -> list[int]:
+    """
+    Transmit a single APDU over an open card handle and return the response.
+    """
+    # http://pyscard.sourceforge.net/epydoc/smartcard.scard.scard-module.html#SCardTransmit
+
+    # SCardTransmit only accepts a list of ints, convert frames handed in as bytes
+    if not isinstance(frame, list):
+        frame = list(frame)
+    hresult, response = SCardTransmit(hcard, pcscprotocolheader, frame)
+    if hresult != 0:
+        # pyscard appends the PCSC error message for hresult only once the exception is formatted
+        raise CardConnectionException(f"Failed to transmit with protocol {pcscprotocolheader}", hresult=hresult)
+    return list(response)
+
+
 class PCSCDevice(Device):
     """DESFire protocol wrapper for pyscard interface."""
 
+    __slots__ = ("card_connection", "_protocol", "_protocol_header")
+
     def __init__(self, card_connection):
         """
         :card_connection: :py:class:`smartcard.pcsc.PCSCCardConnection.PCSCCardConnection` instance.
@@ -25,28 +43,50 @@ class PCSCDevice(Device):
             raise ImportError("pyscard is required for using PCSCDevice")
 
         self.card_connection = card_connection
+        # Last active protocol and its PCSC protocol header, resolved on the first transceive
+        self._protocol = None
+        self._protocol_header = None
 
-    def transceive(self, bytes: list[int]) -> list[int]:
+    def _open_card(self):
+        """
+        Returns the card handle and the PCSC protocol header of the open connection.
+        """
+        hcard = self.card_connection.hcard
+        if not hcard:
+            raise DESFireException(f"Tried to transit to non-open connection: {self.card_connection}")
+
+        # reconnect() and setProtocol() can switch the protocol while keeping the card handle,
+        # so only the translation of the protocol into its PCSC header is cached
+        protocol = self.card_connection.getProtocol()
+        if self._protocol_header is None or protocol != self._protocol:
+            self._protocol = protocol
+            self._protocol_header = translateprotocolheader(protocol)
+        return hcard, self._protocol_header
+
+    def transceive(self, frame: bytes | list[int]) -> list[int]:
         """
         Send in APDU request and wait for the response.
 
         Args:
-            bytes (list[int]): Outgoing bytes as list of bytes or byte array
+            frame (bytes | list[int]): Outgoing bytes as list of bytes or byte array
 
         Returns:
             list[int]: List of bytes or byte array from the device.
         """
-        if not self.card_connection.hcard:
-            raise DESFireException(f"Tried to transit to non-open connection: {self.card_connection}")
+        hcard, pcscprotocolheader = self._open_card()
+        return _transmit(hcard, pcscprotocolheader, frame)
 
-        protocol = self.card_connection.getProtocol()
-        pcscprotocolheader = translateprotocolheader(protocol)
+    def transceive_many(self, frames: list[bytes | list[int]]) -> list[list[int]]:
+        """
+        Send several APDU requests back to back and collect their responses.
 
-        # http://pyscard.sourceforge.net/epydoc/smartcard.scard.scard-module.html#SCardTransmit
+        The card handle and protocol header are resolved once for the whole batch.
 
-        hresult, response = SCardTransmit(self.card_connection.hcard, pcscprotocolheader, bytes)
-        if hresult != 0:
-            raise CardConnectionException(
-                f"Failed to transmit with protocol {str(pcscprotocolheader)}." + SCardGetErrorMessage(hresult)
-            )
-        return list(response)
+        Args:
+            frames (list[bytes | list[int]]): Outgoing APDUs, each as list of bytes or byte array
+
+        Returns:
+            list[list[int]]: Responses from the device, in the order of the frames.
+        """
+        hcard, pcscprotocolheader = self._open_card()
+        return [_transmit(hcard, pcscprotocolheader, frame) for frame in frames]
@@ -246,15 +246,15 @@ class PN532UARTDevice(Device):
         # Return UID of card.
         return response[6 : 6 + response[5]]
 
-    def transceive(self, bytes: list[int]) -> list[int]:
+    def transceive(self, frame: bytes | list[int]) -> list[int]:
         """
         Send in APDU request and wait for the response.
 
         Args:
-            bytes (list[int]): Outgoing bytes as list of bytes or byte array
+            frame (bytes | list[int]): Outgoing bytes as list of bytes or byte array
 
         Returns:
             list[int]: List of bytes or byte array from the device.
         """
-        params = [0x01] + bytes
+        params = [0x01, *frame]
         return self._call_function(_COMMAND_INDATAEXCHANGE, response_length=0xFF, params=params) or []
@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+
+
 class FilePermissions:
     def __init__(self, read_key: int = 0, write_key: int = 0, read_write_key: int = 0, change_key: int = 0):
         """
@@ -16,7 +19,7 @@ class FilePermissions:
         self.read_and_write_access = read_write_key & 0x0F
         self.change_access = change_key & 0x0F
 
-    def parse(self, data: list[int]):
+    def parse(self, data: Sequence[int], offset: int = 0):
         """
         Parse the raw data into a FilePermissions object. Raw data is two bytes, split into 4-bit values.
 
@@ -29,6 +32,9 @@ class FilePermissions:
         - - 8b - 11b: Read key
         - - 12b - 15b: Write key
 
+        The two bytes are read from `data` starting at `offset`, so callers can pass a larger buffer
+        without slicing it first.
+
         Example Data: `0x00 0x23`
 
         ```
@@ -37,10 +43,12 @@ class FilePermissions:
         RW   C    R    W
         ```
         """
-        self.write_access = data[1] & 0x0F
-        self.read_access = (data[1] >> 4) & 0x0F
-        self.change_access = data[0] & 0x0F
-        self.read_and_write_access = (data[0] >> 4) & 0x0F
+        first = data[offset]
+        second = data[offset + 1]
+        self.write_access = second & 0x0F
+        self.read_access = (second >> 4) & 0x0F
+        self.change_access = first & 0x0F
+        self.read_and_write_access = (first >> 4) & 0x0F
 
     def get_permissions(self) -> list[int]:
         """
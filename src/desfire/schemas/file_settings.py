@@ -1,10 +1,31 @@
 import struct
+from array import array
 
 from ..enums import DESFireCommunicationMode, DESFireFileType
 from .file_permissions import FilePermissions
 
+_U32 = struct.Struct("<I")
+
+# Enum member names for __repr__, a dict lookup avoids going through the Enum.name descriptor
+_FT_NAMES = {m: m.name for m in DESFireFileType}
+_CM_NAMES = {m: m.name for m in DESFireCommunicationMode}
+
 
 class FileSettings:
+    __slots__ = (
+        "encryption",
+        "file_type",
+        "permissions",
+        "file_size",
+        "lower_limit",
+        "upper_limit",
+        "value",
+        "limited_credit_value",
+        "limited_credit_enabled",
+        "record_count",
+        "max_record_count",
+    )
+
     def __init__(
         self,
         encryption: DESFireCommunicationMode | None = None,
@@ -76,49 +97,91 @@ class FileSettings:
             - 8b - 11b: Write Permission key
             - 12b - 15b: Read Permission key
 
+        `data` may be any sequence of ints, unsigned byte buffers (`bytes`, `bytearray`, `memoryview`,
+        `array("B")`) are read without copying them.
+
         There are four other file types that are not implemented yet.
         """
 
-        self.file_type = DESFireFileType(data[0])
-        self.encryption = DESFireCommunicationMode(data[1])
+        # Other sequences are converted once, buffer types are read in place
+        buf = data if isinstance(data, (bytes, bytearray, memoryview, array)) else bytes(data)
+        ft = DESFireFileType(buf[0])
+        self.file_type = ft
+        self.encryption = DESFireCommunicationMode(buf[1])
         self.permissions = FilePermissions()
-        self.permissions.parse(data[2:4])
-
-        if self.file_type == DESFireFileType.MDFT_STANDARD_DATA_FILE or self.file_type == DESFireFileType.MDFT_BACKUP_DATA_FILE:
-            # Standard data file, parse file size in bytes. <I is little-endian unsigned int
-            self.file_size = struct.unpack("<I", bytes(data[4:7] + [0x00]))[0]
-        elif self.file_type == DESFireFileType.MDFT_VALUE_FILE_WITH_BACKUP:
-            self.lower_limit = struct.unpack("<I", bytes(data[4:8]))[0]
-            self.upper_limit = struct.unpack("<I", bytes(data[8:12]))[0]
-            self.limited_credit_value = struct.unpack("<I", bytes(data[12:16]))[0]
-            self.limited_credit_enabled = bool(data[16])
-        elif self.file_type == DESFireFileType.MDFT_CYCLIC_RECORD_FILE_WITH_BACKUP or self.file_type == DESFireFileType.MDFT_LINEAR_RECORD_FILE_WITH_BACKUP:
-            self.file_size = struct.unpack("<I", bytes(data[4:7] + [0x00]))[0]
-            self.max_record_count = struct.unpack("<I", bytes(data[7:10] + [0x00]))[0]
-            self.record_count = struct.unpack("<I", bytes(data[10:13] + [0x00]))[0]
-        else:
+        self.permissions.parse(buf, 2)
+
+        handler = self._PARSERS.get(ft)
+        if handler is None:
             # TODO: We currently don't support transaction MAC files
-            raise NotImplementedError(f"Filetype {data[0]:02X} is currently not supported.")
+            raise NotImplementedError(f"Filetype {buf[0]:02X} is currently not supported.")
+        handler(self, buf)
+
+    def _parse_data_file(self, buf: bytes):
+        # File size (3 bytes, little-endian)
+        self.file_size = buf[4] | (buf[5] << 8) | (buf[6] << 16)
+
+    def _parse_value_file(self, buf: bytes):
+        # Lower limit, upper limit and limited credit value (4 bytes each, <I is little-endian unsigned int)
+        self.lower_limit = _U32.unpack_from(buf, 4)[0]
+        self.upper_limit = _U32.unpack_from(buf, 8)[0]
+        self.limited_credit_value = _U32.unpack_from(buf, 12)[0]
+        self.limited_credit_enabled = bool(buf[16])
+
+    def _parse_record_file(self, buf: bytes):
+        # Record size, max record count and current record count (3 bytes each, little-endian)
+        self.file_size = buf[4] | (buf[5] << 8) | (buf[6] << 16)
+        self.max_record_count = buf[7] | (buf[8] << 8) | (buf[9] << 16)
+        self.record_count = buf[10] | (buf[11] << 8) | (buf[12] << 16)
+
+    def _repr_data_file(self) -> list[str]:
+        return [f"File size: {self.file_size}"]
+
+    def _repr_value_file(self) -> list[str]:
+        return [
+            f"Lower limit: {self.lower_limit}",
+            f"Upper limit: {self.upper_limit}",
+            f"Initial value: {self.value}",
+            f"Limited credit value: {self.limited_credit_value}",
+            f"Limited credit enabled: {self.limited_credit_enabled}",
+        ]
+
+    def _repr_record_file(self) -> list[str]:
+        return [
+            f"Record size: {self.file_size}",
+            f"Current record count: {self.record_count}",
+            f"Max record count: {self.max_record_count}",
+        ]
+
+    # Per file type handlers, looked up once instead of walking an if/elif chain
+    _PARSERS = {
+        DESFireFileType.MDFT_STANDARD_DATA_FILE: _parse_data_file,
+        DESFireFileType.MDFT_BACKUP_DATA_FILE: _parse_data_file,
+        DESFireFileType.MDFT_VALUE_FILE_WITH_BACKUP: _parse_value_file,
+        DESFireFileType.MDFT_LINEAR_RECORD_FILE_WITH_BACKUP: _parse_record_file,
+        DESFireFileType.MDFT_CYCLIC_RECORD_FILE_WITH_BACKUP: _parse_record_file,
+    }
+    _REPRS = {
+        DESFireFileType.MDFT_STANDARD_DATA_FILE: _repr_data_file,
+        DESFireFileType.MDFT_BACKUP_DATA_FILE: _repr_data_file,
+        DESFireFileType.MDFT_VALUE_FILE_WITH_BACKUP: _repr_value_file,
+        DESFireFileType.MDFT_LINEAR_RECORD_FILE_WITH_BACKUP: _repr_record_file,
+        DESFireFileType.MDFT_CYCLIC_RECORD_FILE_WITH_BACKUP: _repr_record_file,
+    }
 
     def __repr__(self):
         """
         Returns a human readable representation of the file settings.
         """
-        temp = " ----- FileSettings ----\r\n"
-        temp += f"File type: {self.file_type.name}\r\n"
-        temp += f"Encryption: {self.encryption.name}\r\n"
-        temp += f"Permissions: {repr(self.permissions)}\r\n"
-        if self.file_type == DESFireFileType.MDFT_STANDARD_DATA_FILE or self.file_type == DESFireFileType.MDFT_BACKUP_DATA_FILE:
-            temp += f"File size: {self.file_size}\r\n"
-        elif self.file_type == DESFireFileType.MDFT_VALUE_FILE_WITH_BACKUP:
-            temp += f"Lower limit: {self.lower_limit}\r\n"
-            temp += f"Upper limit: {self.upper_limit}\r\n"
-            temp += f"Initial value: {self.value}\r\n"
-            temp += f"Limited credit value: {self.limited_credit_value}\r\n"
-            temp += f"Limited credit enabled: {self.limited_credit_enabled}\r\n"
-        elif self.file_type == DESFireFileType.MDFT_LINEAR_RECORD_FILE_WITH_BACKUP or self.file_type == DESFireFileType.MDFT_CYCLIC_RECORD_FILE_WITH_BACKUP:
-            temp += f"Record size: {self.file_size}\r\n"
-            temp += f"Current record count: {self.record_count}\r\n"
-            temp += f"Max record count: {self.max_record_count}\r\n"
-
-        return temp
+        ft = self.file_type
+        parts = [
+            " ----- FileSettings ----",
+            f"File type: {_FT_NAMES[ft]}",
+            f"Encryption: {_CM_NAMES[self.encryption]}",
+            f"Permissions: {self.permissions!r}",
+        ]
+        handler = self._REPRS.get(ft)
+        if handler is not None:
+            parts.extend(handler(self))
+
+        return "\r\n".join(parts) + "\r\n"
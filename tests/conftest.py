@@ -0,0 +1,25 @@
+import pytest
+
+from desfire.devices.base import Device
+
+
+class ScriptedDevice(Device):
+    """
+    Device replaying a fixed list of responses, recording the frames it was sent.
+    """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    def transceive(self, frame):
+        self.sent.append(frame)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def scripted_device():
+    """
+    Provides the ScriptedDevice class to create fake devices from a list of responses.
+    """
+    return ScriptedDevice
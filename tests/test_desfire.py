@@ -0,0 +1,74 @@
+import pytest
+
+from desfire import DESFire
+from desfire.exceptions import DESFireCommunicationError
+
+
+def test_communicate_wraps_and_unwraps_iso_apdus(scripted_device):
+    """
+    Native commands are wrapped into ISO 7816 APDUs, Le is only appended when a payload is present.
+    The data of the response is returned without SW1/SW2.
+    """
+    device = scripted_device([[0x91, 0x00], [0xAA, 0xBB, 0x91, 0x00]])
+    card = DESFire(device)
+
+    assert card._communicate([0x6A]) == []
+    assert card._communicate([0xBD, 0x01, 0x02]) == [0xAA, 0xBB]
+    assert device.sent == [
+        [0x90, 0x6A, 0x00, 0x00, 0x00],
+        [0x90, 0xBD, 0x00, 0x00, 0x02, 0x01, 0x02, 0x00],
+    ]
+
+
+def test_communicate_follows_additional_frames(scripted_device):
+    """
+    A 0xAF status is answered with the continue command until the card reports success,
+    the data of all frames is concatenated.
+    """
+    device = scripted_device([[0x01, 0x02, 0x91, 0xAF], [0x03, 0x91, 0xAF], [0x04, 0x91, 0x00]])
+    card = DESFire(device)
+
+    assert card._communicate([0x60]) == [0x01, 0x02, 0x03, 0x04]
+    assert device.sent == [
+        [0x90, 0x60, 0x00, 0x00, 0x00],
+        [0x90, 0xAF, 0x00, 0x00, 0x00],
+        [0x90, 0xAF, 0x00, 0x00, 0x00],
+    ]
+
+
+def test_communicate_af_passthrough(scripted_device):
+    device = scripted_device([[0x01, 0x02, 0x91, 0xAF]])
+    card = DESFire(device)
+
+    assert card._communicate([0x60], af_passthrough=True) == [0x01, 0x02]
+    assert len(device.sent) == 1
+
+
+def test_communicate_rejects_unexpected_sw1(scripted_device):
+    card = DESFire(scripted_device([[0x01, 0x90, 0x00]]))
+
+    with pytest.raises(DESFireCommunicationError) as exc_info:
+        card._communicate([0x60])
+
+    assert exc_info.value.status_code == [0x90, 0x00]
+
+
+def test_communicate_rejects_short_response(scripted_device):
+    card = DESFire(scripted_device([[0x91]]))
+
+    with pytest.raises(DESFireCommunicationError) as exc_info:
+        card._communicate([0x60])
+
+    assert exc_info.value.status_code == [0x91]
+
+
+def test_communicate_raises_card_error_status(scripted_device):
+    """
+    SW2 carries the DESFire status, anything but 0x00 and 0xAF is reported as error.
+    """
+    card = DESFire(scripted_device([[0x91, 0x9D]]))
+
+    with pytest.raises(DESFireCommunicationError) as exc_info:
+        card._communicate([0x60])
+
+    assert exc_info.value.status_code == 0x9D
@@ -0,0 +1,18 @@
+def test_transceive_many_keeps_frame_order(scripted_device):
+    """
+    The default batch implementation sends the frames in order and returns the responses in the same order.
+    """
+    device = scripted_device([[0x91, 0x00], [0x01, 0x91, 0x00], [0x91, 0xAF]])
+    frames = [[0x90, 0x60, 0x00, 0x00, 0x00], [0x90, 0xAF, 0x00, 0x00, 0x00], [0x90, 0xAF, 0x00, 0x00, 0x00]]
+
+    responses = device.transceive_many(frames)
+
+    assert device.sent == frames
+    assert responses == [[0x91, 0x00], [0x01, 0x91, 0x00], [0x91, 0xAF]]
+
+
+def test_transceive_many_empty_batch(scripted_device):
+    device = scripted_device([])
+
+    assert device.transceive_many([]) == []
+    assert device.sent == []
@@ -0,0 +1,29 @@
+from desfire.schemas import FilePermissions
+
+
+def test_parse_two_bytes():
+    """
+    Parses the example permission bytes `0x00 0x23` passed on their own.
+    """
+    permissions = FilePermissions()
+    permissions.parse([0x00, 0x23])
+
+    assert permissions.read_and_write_access == 0x0
+    assert permissions.change_access == 0x0
+    assert permissions.read_access == 0x2
+    assert permissions.write_access == 0x3
+
+
+def test_parse_with_offset():
+    """
+    Reads the permission bytes from within a larger buffer, e.g. a get file settings response.
+    """
+    for data in ([0x00, 0x03, 0x1E, 0x23, 0x08], bytes([0x00, 0x03, 0x1E, 0x23, 0x08])):
+        permissions = FilePermissions()
+        permissions.parse(data, 2)
+
+        assert permissions.read_and_write_access == 0x1
+        assert permissions.change_access == 0xE
+        assert permissions.read_access == 0x2
+        assert permissions.write_access == 0x3
+        assert permissions.get_permissions() == [0x1E, 0x23]
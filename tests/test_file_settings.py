@@ -0,0 +1,68 @@
+from array import array
+
+from desfire.enums import DESFireCommunicationMode, DESFireFileType
+from desfire.schemas import FileSettings
+
+
+def test_parse_standard_data_file():
+    """
+    Parses the example response of command 0xF5 (get file settings) for a standard data file.
+    """
+    file_settings = FileSettings()
+    file_settings.parse([0x00, 0x03, 0x00, 0x23, 0x08, 0x00, 0x00])
+
+    assert file_settings.file_type == DESFireFileType.MDFT_STANDARD_DATA_FILE
+    assert file_settings.encryption == DESFireCommunicationMode.ENCRYPTED
+    assert file_settings.permissions.read_access == 0x2
+    assert file_settings.permissions.write_access == 0x3
+    assert file_settings.file_size == 8
+
+
+def test_parse_value_file():
+    """
+    Value files carry three little-endian 4-byte values followed by the limited credit flag.
+    """
+    file_settings = FileSettings()
+    file_settings.parse(
+        [0x02, 0x00, 0x00, 0x00]
+        + [0x00, 0x00, 0x00, 0x00]
+        + [0xE8, 0x03, 0x00, 0x00]
+        + [0x64, 0x00, 0x00, 0x00]
+        + [0x01]
+    )
+
+    assert file_settings.file_type == DESFireFileType.MDFT_VALUE_FILE_WITH_BACKUP
+    assert file_settings.lower_limit == 0
+    assert file_settings.upper_limit == 1000
+    assert file_settings.limited_credit_value == 100
+    assert file_settings.limited_credit_enabled is True
+
+
+def test_parse_record_file():
+    """
+    Record files carry the record size, the maximum and the current record count as 3-byte values.
+    """
+    file_settings = FileSettings()
+    file_settings.parse([0x04, 0x01, 0x12, 0x34, 0x10, 0x00, 0x00, 0x00, 0x01, 0x00, 0x05, 0x00, 0x00])
+
+    assert file_settings.file_type == DESFireFileType.MDFT_CYCLIC_RECORD_FILE_WITH_BACKUP
+    assert file_settings.encryption == DESFireCommunicationMode.CMAC
+    assert file_settings.file_size == 16
+    assert file_settings.max_record_count == 256
+    assert file_settings.record_count == 5
+    assert "Max record count: 256" in repr(file_settings)
+
+
+def test_parse_buffer_input():
+    """
+    Other sequences and buffer types yield the same settings as a list of ints.
+    """
+    raw = [0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE8, 0x03, 0x00, 0x00, 0x64, 0x00, 0x00, 0x00, 0x01]
+
+    for data in (tuple(raw), bytes(raw), memoryview(bytes(raw)), array("B", raw)):
+        file_settings = FileSettings()
+        file_settings.parse(data)
+
+        assert file_settings.upper_limit == 1000
+        assert file_settings.limited_credit_value == 100
+        assert file_settings.limited_credit_enabled is True
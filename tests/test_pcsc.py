@@ -0,0 +1,114 @@
+import importlib
+import sys
+import types
+
+import pytest
+
+import desfire.devices.pcsc
+
+T0 = 1
+T1 = 2
+
+
+class FakeCardConnectionException(Exception):
+    def __init__(self, message="", hresult=-1, *args):
+        super().__init__(message, *args)
+        self.hresult = hresult
+
+
+class FakeConnection:
+    hcard = 0x1234
+
+    def __init__(self, protocol):
+        self.protocol = protocol
+        self.protocol_reads = 0
+
+    def getProtocol(self):
+        self.protocol_reads += 1
+        return self.protocol
+
+
+@pytest.fixture
+def pcsc():
+    """
+    Provides the pcsc device module loaded against a stubbed pyscard, recording transmitted frames.
+    """
+    transmitted = []
+
+    def translateprotocolheader(protocol):
+        return {None: 0, T0: "T0_HEADER", T1: "T1_HEADER"}[protocol]
+
+    def SCardTransmit(hcard, header, frame):
+        transmitted.append((hcard, header, frame))
+        return 0, [0x91, 0x00]
+
+    exceptions = types.ModuleType("smartcard.Exceptions")
+    exceptions.CardConnectionException = FakeCardConnectionException
+    connection = types.ModuleType("smartcard.pcsc.PCSCCardConnection")
+    connection.translateprotocolheader = translateprotocolheader
+    scard = types.ModuleType("smartcard.scard")
+    scard.SCardTransmit = SCardTransmit
+    stubs = {
+        "smartcard": types.ModuleType("smartcard"),
+        "smartcard.Exceptions": exceptions,
+        "smartcard.pcsc": types.ModuleType("smartcard.pcsc"),
+        "smartcard.pcsc.PCSCCardConnection": connection,
+        "smartcard.scard": scard,
+    }
+
+    saved = {name: sys.modules.get(name) for name in stubs}
+    sys.modules.update(stubs)
+    try:
+        module = importlib.reload(desfire.devices.pcsc)
+        module.transmitted = transmitted
+        yield module
+    finally:
+        for name, original in saved.items():
+            if original is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = original
+        importlib.reload(desfire.devices.pcsc)
+
+
+def test_transceive_sends_frame_as_list(pcsc):
+    device = pcsc.PCSCDevice(FakeConnection(T0))
+
+    assert device.transceive(bytes([0x90, 0x60, 0x00, 0x00, 0x00])) == [0x91, 0x00]
+    assert pcsc.transmitted == [(0x1234, "T0_HEADER", [0x90, 0x60, 0x00, 0x00, 0x00])]
+
+
+def test_transceive_follows_protocol_change(pcsc):
+    """
+    A reconnect or setProtocol() may switch the protocol on the same card handle, the next frame
+    has to be sent with the header of the new protocol.
+    """
+    conn = FakeConnection(T0)
+    device = pcsc.PCSCDevice(conn)
+
+    device.transceive([0x90, 0x60, 0x00, 0x00, 0x00])
+    conn.protocol = T1
+    device.transceive([0x90, 0x60, 0x00, 0x00, 0x00])
+
+    assert [header for _, header, _ in pcsc.transmitted] == ["T0_HEADER", "T1_HEADER"]
+
+
+def test_transceive_without_protocol(pcsc):
+    """
+    getProtocol() returns None after setProtocol(None), which still has to be translated.
+    """
+    device = pcsc.PCSCDevice(FakeConnection(None))
+
+    device.transceive([0x90, 0x60, 0x00, 0x00, 0x00])
+
+    assert pcsc.transmitted == [(0x1234, 0, [0x90, 0x60, 0x00, 0x00, 0x00])]
+
+
+def test_transceive_many_resolves_connection_once(pcsc):
+    conn = FakeConnection(T0)
+    device = pcsc.PCSCDevice(conn)
+    frames = [[0x90, 0x60, 0x00, 0x00, 0x00], [0x90, 0xAF, 0x00, 0x00, 0x00]]
+
+    assert device.transceive_many(frames) == [[0x91, 0x00], [0x91, 0x00]]
+    assert conn.protocol_reads == 1
+    assert pcsc.transmitted == [(0x1234, "T0_HEADER", frame) for frame in frames]